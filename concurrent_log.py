@@ -7,28 +7,126 @@ import csv
 import re
 import sys
 import argparse
-import os
+import math
+import socket
+import struct
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 import signal
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-import pandas as pd
-import numpy as np
+
+# CSV column order
+FIELDNAMES = (
+    'timestamp', 'latency_ms', 'rx_bitrate_mbps', 'tx_bitrate_mbps',
+    'signal_strength_dbm', 'frequency_mhz', 'width_mhz',
+    'centre_frequency_mhz', 'tx_power_dbm'
+)
+
+# Rows buffered per Parquet row group when writing .parquet output
+PARQUET_BATCH_ROWS = 64
+
+# Columns with running min/max/sum/count maintained while sampling
+NUMERIC_COLS = FIELDNAMES[1:]
+
+# Minimum time between progress line updates
+PROGRESS_INTERVAL_NS = 1_000_000_000
+
+# Number of rows buffered before the CSV file is flushed
+CSV_FLUSH_ROWS = 16
+
+# Patterns for parsing ping/iw output, compiled once and matched against raw bytes
+PING_RE = re.compile(rb'time=([0-9.]+)')
+# Each alternative captures one field, so the output is scanned in a single pass
+# and the field is identified by the index of the group that matched
+LINK_RE = re.compile(
+    rb'rx bitrate:\s+([0-9.]+)\s+MBit/s'
+    rb'|tx bitrate:\s+([0-9.]+)\s+MBit/s'
+    rb'|signal:\s+(-?[0-9]+)\s+dBm'
+)
+LINK_TYPES = (float, float, int)
+INFO_RE = re.compile(
+    rb'channel\s+\d+\s+\((\d+)\s+MHz\)'
+    rb'|width:\s+(\d+)\s+MHz'
+    rb'|center1:\s+(\d+)\s+MHz'
+    rb'|txpower\s+([0-9.]+)\s+dBm'
+)
+INFO_TYPES = (int, int, int, float)
+
+# SO_TIMESTAMPNS from <asm-generic/socket.h>; not exported by the socket module
+SO_TIMESTAMPNS = getattr(socket, 'SO_TIMESTAMPNS', 35)
+
+# nl80211 channel width enum -> width in MHz, as reported by `iw dev <if> info`
+CHANNEL_WIDTH_MHZ = {
+    0: 20, 1: 20, 2: 40, 3: 80, 4: 80, 5: 160, 6: 5, 7: 10,
+    8: 1, 9: 2, 10: 4, 11: 8, 12: 16, 13: 320,
+}
 
 class NetworkMonitor:
-    def __init__(self, target_ip, interface="wlan0", duration=3600, interval=5, output_file=None, plot_dir=None):
+    def __init__(self, target_ip, interface="wlan0", duration=3600, interval=5, output_file=None, info_interval=60):
         self.target_ip = target_ip
         self.interface = interface
         self.duration = duration  # Duration in seconds
         self.interval = interval  # Sample interval in seconds
+        self.info_interval = info_interval  # Interface info refresh interval in seconds
         self.output_file = output_file or f"network_monitor_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        self.plot_dir = plot_dir or f"network_plots_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.running = True
-        self.data_lock = threading.Lock()
+        # Fallback commands, built once and exec'd directly without a shell
+        self.ping_cmd = ["ping", "-c", "1", "-W", "1", self.target_ip]
+        self.link_cmd = ["iw", "dev", self.interface, "link"]
+        self.info_cmd = ["iw", "dev", self.interface, "info"]
+        
+        # Query nl80211 directly over netlink when pyroute2 is available,
+        # otherwise fall back to parsing `iw` output
+        self.iw = None
+        self.iw_lock = threading.Lock()
+        try:
+            from pyroute2 import IW
+            self.ifindex = socket.if_nametoindex(self.interface)
+            self.iw = IW()
+        except Exception:
+            self.iw = None
         
-        # Create plot directory
-        os.makedirs(self.plot_dir, exist_ok=True)
+        # Unprivileged ICMP echo socket (needs net.ipv4.ping_group_range),
+        # otherwise fall back to the ping binary. The target is resolved once
+        # and the socket family follows its address, so IPv6 targets work too
+        self.ping_seq = 0
+        self.icmp_sock = None
+        try:
+            family, _, _, _, self.target_addr = socket.getaddrinfo(self.target_ip, None, type=socket.SOCK_DGRAM)[0]
+            if family == socket.AF_INET6:
+                protocol, self.echo_request, self.echo_reply = socket.IPPROTO_ICMPV6, 128, 129
+            else:
+                protocol, self.echo_request, self.echo_reply = socket.IPPROTO_ICMP, 8, 0
+            self.icmp_sock = socket.socket(family, socket.SOCK_DGRAM, protocol)
+            self.icmp_sock.settimeout(1)
+            # Have the kernel stamp each reply on arrival, so the latency stays
+            # accurate even when the reply is read after other work
+            self.icmp_sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
+        except OSError:
+            if self.icmp_sock is not None:
+                self.icmp_sock.close()
+            self.icmp_sock = None
+        
+        # CSV output stays open for the whole run, see write_csv_header
+        self.csv_file = None
+        self.csv_writer = None
+        self.pending_rows = 0
+        
+        # Parquet output is used instead when output_file ends in .parquet,
+        # see open_parquet
+        self.parquet = self.output_file.endswith('.parquet')
+        self.parquet_writer = None
+        self.parquet_rows = []
+        
+        # Running [min, max, sum, count] per column, see update_stats
+        self.stats = {col: [math.inf, -math.inf, 0.0, 0] for col in NUMERIC_COLS}
+        
+        # Frequency, width and TX power rarely change, so they are cached
+        # and only re-read every info_interval seconds
+        self.info_cache = (None, None, None, None)
+        self.info_last = -math.inf
+        
+        # Worker threads are reused across samples rather than spawned per sample
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="nm")
         
         # Setup signal handling for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -38,313 +136,299 @@ class NetworkMonitor:
         print("\nReceived interrupt signal. Stopping monitoring...")
         self.running = False
     
+    def close(self):
+        """Release the worker threads and sockets held across samples"""
+        self.executor.shutdown(wait=False)
+        if self.iw is not None:
+            self.iw.close()
+        if self.icmp_sock is not None:
+            self.icmp_sock.close()
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = None
+        if self.parquet_writer is not None:
+            # Always write the footer, or the row groups already written
+            # become unreadable when the last batch fails
+            try:
+                self.write_parquet_batch()
+            finally:
+                self.parquet_writer.close()
+                self.parquet_writer = None
+    
     def run_command(self, command):
-        """Run a shell command and return its output"""
+        """Run a command (argv list) and return its raw output bytes"""
         try:
-            result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=10)
-            return result.stdout.strip() if result.returncode == 0 else ""
+            result = subprocess.run(command, shell=False, capture_output=True, timeout=10)
+            return result.stdout.strip() if result.returncode == 0 else b""
         except subprocess.TimeoutExpired:
-            return ""
+            return b""
         except Exception:
-            return ""
+            return b""
     
     def get_ping_latency(self):
         """Extract ping latency in milliseconds"""
-        command = f"ping -c 1 -W 1 {self.target_ip}"
-        output = self.run_command(command)
+        if self.icmp_sock is not None:
+            return self.get_icmp_latency()
+        
+        output = self.run_command(self.ping_cmd)
         
         # Look for time=X.XXX pattern
-        match = re.search(r'time=([0-9.]+)', output)
+        match = PING_RE.search(output)
         return float(match.group(1)) if match else None
     
+    def get_icmp_latency(self):
+        """Send one ICMP echo request and time the reply in milliseconds"""
+        return self.receive_echo(self.send_echo())
+    
+    def send_echo(self):
+        """Send one ICMP echo request and return its send time in ns"""
+        self.ping_seq = (self.ping_seq + 1) & 0xFFFF
+        # The kernel fills in the identifier and checksum for ICMP datagram sockets
+        packet = struct.pack('!BBHHH', self.echo_request, 0, 0, 0, self.ping_seq) + b'\x00' * 8
+        
+        try:
+            sent_ns = time.time_ns()
+            self.icmp_sock.sendto(packet, self.target_addr)
+            return sent_ns
+        except OSError:
+            return None
+    
+    def receive_echo(self, sent_ns):
+        """Wait for the reply to the last echo request and return its latency in ms"""
+        if sent_ns is None:
+            return None
+        
+        try:
+            while True:
+                reply, ancdata, _, _ = self.icmp_sock.recvmsg(1024, 64)
+                # Echo reply with our sequence number; stale replies are skipped
+                if len(reply) >= 8 and reply[0] == self.echo_reply and struct.unpack('!H', reply[6:8])[0] == self.ping_seq:
+                    break
+        except OSError:
+            return None
+        
+        received_ns = time.time_ns()
+        for level, kind, data in ancdata:
+            if level == socket.SOL_SOCKET and kind == SO_TIMESTAMPNS:
+                seconds, nanoseconds = struct.unpack('ll', data[:struct.calcsize('ll')])
+                received_ns = seconds * 1_000_000_000 + nanoseconds
+        
+        return round((received_ns - sent_ns) / 1e6, 3)
+    
+    def parse_iw_output(self, output, pattern, types):
+        """Extract one value per capture group of a combined iw pattern"""
+        values = [None] * len(types)
+        for match in pattern.finditer(output):
+            index = match.lastindex - 1
+            # Keep the first occurrence, as a plain search would
+            if values[index] is None:
+                values[index] = types[index](match.group(match.lastindex))
+        return values
+    
     def get_link_info(self):
         """Extract RX/TX bitrate and signal strength from iw link"""
-        command = f"iw dev {self.interface} link"
-        output = self.run_command(command)
+        if self.iw is not None:
+            return self.get_station_info()
         
-        # Extract RX bitrate
-        rx_match = re.search(r'rx bitrate:\s+([0-9.]+)\s+MBit/s', output)
-        rx_bitrate = float(rx_match.group(1)) if rx_match else None
+        output = self.run_command(self.link_cmd)
         
-        # Extract TX bitrate
-        tx_match = re.search(r'tx bitrate:\s+([0-9.]+)\s+MBit/s', output)
-        tx_bitrate = float(tx_match.group(1)) if tx_match else None
+        rx_bitrate, tx_bitrate, signal_strength = self.parse_iw_output(output, LINK_RE, LINK_TYPES)
         
-        # Extract signal strength
-        signal_match = re.search(r'signal:\s+(-?[0-9]+)\s+dBm', output)
-        signal_strength = int(signal_match.group(1)) if signal_match else None
+        return rx_bitrate, tx_bitrate, signal_strength
+    
+    def get_station_info(self):
+        """Read RX/TX bitrate and signal strength of the associated AP over nl80211"""
+        try:
+            with self.iw_lock:
+                stations = list(self.iw.get_stations(self.ifindex))
+        except Exception:
+            return None, None, None
+        
+        if not stations:
+            return None, None, None
+        
+        sta_info = stations[0].get_attr('NL80211_ATTR_STA_INFO')
+        if sta_info is None:
+            return None, None, None
+        
+        # Bitrates are reported in units of 100 kbit/s
+        rx_rate = sta_info.get_attr('NL80211_STA_INFO_RX_BITRATE')
+        rx_bitrate = rx_rate.get_attr('NL80211_RATE_INFO_BITRATE32') if rx_rate else None
+        rx_bitrate = rx_bitrate / 10 if rx_bitrate is not None else None
+        
+        tx_rate = sta_info.get_attr('NL80211_STA_INFO_TX_BITRATE')
+        tx_bitrate = tx_rate.get_attr('NL80211_RATE_INFO_BITRATE32') if tx_rate else None
+        tx_bitrate = tx_bitrate / 10 if tx_bitrate is not None else None
+        
+        signal_strength = sta_info.get_attr('NL80211_STA_INFO_SIGNAL')
         
         return rx_bitrate, tx_bitrate, signal_strength
     
     def get_interface_info(self):
         """Extract frequency, width, centre frequency, and TX power from iw info"""
-        command = f"iw dev {self.interface} info"
-        output = self.run_command(command)
+        if self.iw is not None:
+            return self.get_wiphy_info()
+        
+        output = self.run_command(self.info_cmd)
+        
+        frequency, width, centre_frequency, tx_power = self.parse_iw_output(output, INFO_RE, INFO_TYPES)
+        if centre_frequency is None:
+            centre_frequency = frequency
         
-        # Extract frequency
-        freq_match = re.search(r'channel\s+\d+\s+\((\d+)\s+MHz\)', output)
-        frequency = int(freq_match.group(1)) if freq_match else None
+        return frequency, width, centre_frequency, tx_power
+    
+    def get_cached_interface_info(self):
+        """Return interface info, re-reading it once info_interval has elapsed"""
+        now = time.monotonic()
+        if now - self.info_last >= self.info_interval:
+            info = self.get_interface_info()
+            self.info_cache = info
+            # Retry on the next sample if the query came back empty
+            if any(value is not None for value in info):
+                self.info_last = now
+        return self.info_cache
+    
+    def get_wiphy_info(self):
+        """Read frequency, width, centre frequency, and TX power over nl80211"""
+        try:
+            with self.iw_lock:
+                interfaces = list(self.iw.get_interface_by_ifindex(self.ifindex))
+        except Exception:
+            return None, None, None, None
         
-        # Extract channel width
-        width_match = re.search(r'width:\s+(\d+)\s+MHz', output)
-        width = int(width_match.group(1)) if width_match else None
+        if not interfaces:
+            return None, None, None, None
         
-        # Extract center frequency
-        center_match = re.search(r'center1:\s+(\d+)\s+MHz', output)
-        centre_frequency = int(center_match.group(1)) if center_match else frequency
+        msg = interfaces[0]
+        frequency = msg.get_attr('NL80211_ATTR_WIPHY_FREQ')
+        width = CHANNEL_WIDTH_MHZ.get(msg.get_attr('NL80211_ATTR_CHANNEL_WIDTH'))
+        centre_frequency = msg.get_attr('NL80211_ATTR_CENTER_FREQ1') or frequency
         
-        # Extract TX power
-        power_match = re.search(r'txpower\s+([0-9.]+)\s+dBm', output)
-        tx_power = float(power_match.group(1)) if power_match else None
+        # TX power is reported in mBm
+        power_level = msg.get_attr('NL80211_ATTR_WIPHY_TX_POWER_LEVEL')
+        tx_power = power_level / 100 if power_level is not None else None
         
         return frequency, width, centre_frequency, tx_power
     
     def collect_data_sample(self):
-        """Collect one sample of data from all three commands concurrently"""
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            # Submit all three tasks concurrently
-            ping_future = executor.submit(self.get_ping_latency)
-            link_future = executor.submit(self.get_link_info)
-            info_future = executor.submit(self.get_interface_info)
+        """Collect one sample of data from all three commands concurrently as a row tuple"""
+        if self.iw is not None and self.icmp_sock is not None:
+            # Every query is a plain socket round-trip, so overlap them on this
+            # thread: the netlink requests run while the echo is in flight
+            sent_ns = self.send_echo()
+            rx_bitrate, tx_bitrate, signal_strength = self.get_link_info()
+            frequency, width, centre_frequency, tx_power = self.get_cached_interface_info()
+            latency = self.receive_echo(sent_ns)
+        else:
+            # Run ping and iw link concurrently while interface info is
+            # read (or taken from the cache) on this thread
+            ping_future = self.executor.submit(self.get_ping_latency)
+            link_future = self.executor.submit(self.get_link_info)
+            frequency, width, centre_frequency, tx_power = self.get_cached_interface_info()
             
             # Wait for all tasks to complete
             latency = ping_future.result()
             rx_bitrate, tx_bitrate, signal_strength = link_future.result()
-            frequency, width, centre_frequency, tx_power = info_future.result()
-        
-        return {
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'latency_ms': latency,
-            'rx_bitrate_mbps': rx_bitrate,
-            'tx_bitrate_mbps': tx_bitrate,
-            'signal_strength_dbm': signal_strength,
-            'frequency_mhz': frequency,
-            'width_mhz': width,
-            'centre_frequency_mhz': centre_frequency,
-            'tx_power_dbm': tx_power
-        }
+        
+        # Row in FIELDNAMES order
+        return (
+            self.format_timestamp(),
+            latency,
+            rx_bitrate,
+            tx_bitrate,
+            signal_strength,
+            frequency,
+            width,
+            centre_frequency,
+            tx_power
+        )
     
     def write_csv_header(self):
-        """Write CSV header to output file"""
-        fieldnames = [
-            'timestamp', 'latency_ms', 'rx_bitrate_mbps', 'tx_bitrate_mbps',
-            'signal_strength_dbm', 'frequency_mhz', 'width_mhz', 
-            'centre_frequency_mhz', 'tx_power_dbm'
-        ]
-        
-        with open(self.output_file, 'w', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-    
-    def write_data_row(self, data):
-        """Append data row to CSV file"""
-        fieldnames = [
-            'timestamp', 'latency_ms', 'rx_bitrate_mbps', 'tx_bitrate_mbps',
-            'signal_strength_dbm', 'frequency_mhz', 'width_mhz', 
-            'centre_frequency_mhz', 'tx_power_dbm'
-        ]
-        
-        with self.data_lock:
-            with open(self.output_file, 'a', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writerow(data)
-    
-    def calculate_statistics(self, data, column_name):
-        """Calculate min, mean, max for a data column"""
-        valid_data = [x for x in data if x is not None and not pd.isna(x)]
-        if not valid_data:
-            return None, None, None
-        
-        return np.min(valid_data), np.mean(valid_data), np.max(valid_data)
+        """Open the CSV output file and write its header"""
+        self.csv_file = open(self.output_file, 'w', newline='', buffering=1 << 16)
+        self.csv_writer = csv.writer(self.csv_file)
+        self.csv_writer.writerow(FIELDNAMES)
+    
+    def open_parquet(self):
+        """Open a zstd-compressed Parquet writer for the output file"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        self.parquet_schema = pa.schema([
+            ('timestamp', pa.timestamp('s')),
+            ('latency_ms', pa.float32()),
+            ('rx_bitrate_mbps', pa.float32()),
+            ('tx_bitrate_mbps', pa.float32()),
+            ('signal_strength_dbm', pa.int16()),
+            ('frequency_mhz', pa.int32()),
+            ('width_mhz', pa.int16()),
+            ('centre_frequency_mhz', pa.int32()),
+            ('tx_power_dbm', pa.float32()),
+        ])
+        # Rows carry formatted timestamps; they are cast per batch on write
+        self.parquet_row_schema = self.parquet_schema.set(0, pa.field('timestamp', pa.string()))
+        self.parquet_writer = pq.ParquetWriter(self.output_file, self.parquet_schema, compression='zstd')
     
-    def create_plots(self):
-        """Generate plots for each data category"""
-        print(f"\nGenerating plots and calculating statistics...")
+    def write_parquet_batch(self):
+        """Write the buffered rows to the Parquet file as one row group"""
+        if not self.parquet_rows:
+            return
         
-        # Read the CSV data
-        try:
-            df = pd.read_csv(self.output_file)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-        except Exception as e:
-            print(f"Error reading CSV file: {e}")
+        import pyarrow as pa
+        
+        columns = [list(column) for column in zip(*self.parquet_rows)]
+        table = pa.Table.from_arrays(columns, schema=self.parquet_row_schema)
+        self.parquet_writer.write_table(table.cast(self.parquet_schema))
+        self.parquet_rows = []
+    
+    def write_data_row(self, row):
+        """Append data row to the output file, flushing in batches"""
+        if self.parquet:
+            self.parquet_rows.append(row)
+            if len(self.parquet_rows) >= PARQUET_BATCH_ROWS:
+                self.write_parquet_batch()
             return
         
-        # Configure matplotlib for better appearance
-        plt.style.use('default')
-        plt.rcParams['figure.figsize'] = (12, 8)
-        plt.rcParams['font.size'] = 10
-        
-        # Define plot configurations
-        plot_configs = [
-            {
-                'column': 'latency_ms',
-                'title': 'Ping Latency Over Time',
-                'ylabel': 'Latency (ms)',
-                'color': '#2E86C1',
-                'filename': 'latency.png'
-            },
-            {
-                'column': 'rx_bitrate_mbps',
-                'title': 'RX Bitrate Over Time',
-                'ylabel': 'RX Bitrate (Mbps)',
-                'color': '#28B463',
-                'filename': 'rx_bitrate.png'
-            },
-            {
-                'column': 'tx_bitrate_mbps',
-                'title': 'TX Bitrate Over Time',
-                'ylabel': 'TX Bitrate (Mbps)',
-                'color': '#E74C3C',
-                'filename': 'tx_bitrate.png'
-            },
-            {
-                'column': 'signal_strength_dbm',
-                'title': 'Signal Strength Over Time',
-                'ylabel': 'Signal Strength (dBm)',
-                'color': '#8E44AD',
-                'filename': 'signal_strength.png'
-            },
-            {
-                'column': 'frequency_mhz',
-                'title': 'Operating Frequency Over Time',
-                'ylabel': 'Frequency (MHz)',
-                'color': '#F39C12',
-                'filename': 'frequency.png'
-            },
-            {
-                'column': 'width_mhz',
-                'title': 'Channel Width Over Time',
-                'ylabel': 'Width (MHz)',
-                'color': '#17A2B8',
-                'filename': 'channel_width.png'
-            },
-            {
-                'column': 'centre_frequency_mhz',
-                'title': 'Centre Frequency Over Time',
-                'ylabel': 'Centre Frequency (MHz)',
-                'color': '#FD7E14',
-                'filename': 'centre_frequency.png'
-            },
-            {
-                'column': 'tx_power_dbm',
-                'title': 'TX Power Over Time',
-                'ylabel': 'TX Power (dBm)',
-                'color': '#6F42C1',
-                'filename': 'tx_power.png'
-            }
-        ]
+        self.csv_writer.writerow(row)
+        self.pending_rows += 1
+        if self.pending_rows >= CSV_FLUSH_ROWS:
+            self.csv_file.flush()
+            self.pending_rows = 0
+    
+    def update_stats(self, row):
+        """Fold one sample into the running per-column statistics"""
+        # stats is keyed in NUMERIC_COLS order, i.e. the row minus its timestamp
+        for stat, value in zip(self.stats.values(), row[1:]):
+            if value is not None:
+                stat[0] = min(stat[0], value)
+                stat[1] = max(stat[1], value)
+                stat[2] += value
+                stat[3] += 1
+    
+    def running_statistics(self, column_name):
+        """Return min, mean, max collected while sampling"""
+        min_val, max_val, total, count = self.stats[column_name]
+        if not count:
+            return None, None, None
         
+        return min_val, total / count, max_val
+    
+    def print_statistics(self):
+        """Print min, mean, max of each column collected while sampling"""
         print("\nStatistical Summary:")
         print("=" * 60)
-        
-        # Create individual plots
-        for config in plot_configs:
-            column = config['column']
-            
-            # Skip if column doesn't exist or has no data
-            if column not in df.columns:
-                continue
-                
-            # Calculate statistics
-            min_val, mean_val, max_val = self.calculate_statistics(df[column], column)
-            
+        for column in NUMERIC_COLS:
+            min_val, mean_val, max_val = self.running_statistics(column)
             if min_val is None:
-                print(f"{config['title']:<30}: No valid data")
-                continue
-            
-            # Print statistics
-            print(f"{config['title']:<30}: Min={min_val:.2f}, Mean={mean_val:.2f}, Max={max_val:.2f}")
-            
-            # Create plot
-            fig, ax = plt.subplots(figsize=(12, 8))
-            
-            # Plot the data
-            valid_mask = df[column].notna()
-            ax.plot(df.loc[valid_mask, 'timestamp'], 
-                   df.loc[valid_mask, column], 
-                   color=config['color'], 
-                   linewidth=1.5, 
-                   alpha=0.8,
-                   label=f'{column.replace("_", " ").title()}')
-            
-            # Add horizontal lines for min, mean, max
-            ax.axhline(y=mean_val, color='red', linestyle='--', alpha=0.7, label=f'Mean: {mean_val:.2f}')
-            ax.axhline(y=min_val, color='green', linestyle=':', alpha=0.7, label=f'Min: {min_val:.2f}')
-            ax.axhline(y=max_val, color='orange', linestyle=':', alpha=0.7, label=f'Max: {max_val:.2f}')
-            
-            # Formatting
-            ax.set_title(config['title'], fontsize=14, fontweight='bold', pad=20)
-            ax.set_xlabel('Time', fontsize=12)
-            ax.set_ylabel(config['ylabel'], fontsize=12)
-            ax.grid(True, alpha=0.3)
-            ax.legend(loc='upper right', framealpha=0.9)
-            
-            # Format x-axis
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-            ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=max(1, len(df) // 20)))
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-            
-            # Tight layout and save
-            plt.tight_layout()
-            plot_path = os.path.join(self.plot_dir, config['filename'])
-            plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-            plt.close()
-        
-        # Create a combined overview plot
-        self.create_overview_plot(df, plot_configs)
-        
+                print(f"{column:<30}: No valid data")
+            else:
+                print(f"{column:<30}: Min={min_val:.2f}, Mean={mean_val:.2f}, Max={max_val:.2f}")
         print("=" * 60)
-        print(f"Plots saved to directory: {self.plot_dir}")
     
-    def create_overview_plot(self, df, plot_configs):
-        """Create a combined overview plot with all metrics"""
-        fig, axes = plt.subplots(2, 4, figsize=(20, 12))
-        axes = axes.flatten()
-        
-        fig.suptitle('Network Monitoring Overview', fontsize=16, fontweight='bold')
-        
-        for i, config in enumerate(plot_configs):
-            if i >= len(axes):
-                break
-            
-            column = config['column']
-            ax = axes[i]
-            
-            if column not in df.columns:
-                ax.text(0.5, 0.5, 'No Data', ha='center', va='center', transform=ax.transAxes)
-                ax.set_title(config['title'])
-                continue
-            
-            valid_mask = df[column].notna()
-            if not valid_mask.any():
-                ax.text(0.5, 0.5, 'No Valid Data', ha='center', va='center', transform=ax.transAxes)
-                ax.set_title(config['title'])
-                continue
-            
-            # Plot data
-            ax.plot(df.loc[valid_mask, 'timestamp'], 
-                   df.loc[valid_mask, column], 
-                   color=config['color'], 
-                   linewidth=1, 
-                   alpha=0.8)
-            
-            # Calculate and add mean line
-            mean_val = df[column].mean()
-            if not pd.isna(mean_val):
-                ax.axhline(y=mean_val, color='red', linestyle='--', alpha=0.5)
-            
-            ax.set_title(config['title'], fontsize=10)
-            ax.set_ylabel(config['ylabel'], fontsize=9)
-            ax.grid(True, alpha=0.3)
-            ax.tick_params(axis='x', labelsize=8, rotation=45)
-            ax.tick_params(axis='y', labelsize=8)
-        
-        plt.tight_layout()
-        overview_path = os.path.join(self.plot_dir, 'overview.png')
-        plt.savefig(overview_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print(f"Overview plot saved as: overview.png")
+    def format_timestamp(self, now=None):
+        """Format a Unix time (default: now) as YYYY-MM-DD HH:MM:SS local time"""
+        t = time.localtime(now)
+        return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
     
     def format_time(self, seconds):
         """Format seconds into HH:MM:SS"""
@@ -353,6 +437,17 @@ class NetworkMonitor:
         seconds = seconds % 60
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
     
+    def print_progress(self, row, start_time, end_time):
+        """Redraw the progress line for the latest sample"""
+        current_time = time.monotonic()
+        elapsed = int(current_time - start_time)
+        remaining = max(0, int(end_time - current_time))
+        
+        sys.stdout.write(f"\rElapsed: {self.format_time(elapsed)} | "
+                         f"Remaining: {self.format_time(remaining)} | "
+                         f"Latest ping: {row[1] or 'N/A'}ms")
+        sys.stdout.flush()
+    
     def run(self):
         """Main monitoring loop"""
         print("Starting network monitoring...")
@@ -360,45 +455,69 @@ class NetworkMonitor:
         print(f"Interface: {self.interface}")
         print(f"Duration: {self.duration} seconds ({self.duration//60} minutes)")
         print(f"Output file: {self.output_file}")
-        print(f"Plot directory: {self.plot_dir}")
         print(f"Sampling every {self.interval} seconds")
+        print(f"Refreshing interface info every {self.info_interval} seconds")
         print("Press Ctrl+C to stop early")
         print()
         
-        # Initialize CSV file
-        self.write_csv_header()
+        # Initialize output file
+        if self.parquet:
+            self.open_parquet()
+        else:
+            self.write_csv_header()
         
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
+        start_time = start_ns / 1e9
         end_time = start_time + self.duration
+        next_tick = start_time
+        
+        # Progress deadlines sit on the same grid as the sampling ticks, so
+        # with a 1 s interval every sample still gets its update
+        next_progress_ns = start_ns
+        row = None
         
         try:
-            while self.running and time.time() < end_time:
+            while self.running and time.monotonic() < end_time:
                 # Collect data sample
-                data = self.collect_data_sample()
+                row = self.collect_data_sample()
+                self.update_stats(row)
                 
                 # Write to CSV
-                self.write_data_row(data)
-                
-                # Display progress
-                current_time = time.time()
-                elapsed = int(current_time - start_time)
-                remaining = int(end_time - current_time)
+                self.write_data_row(row)
                 
-                print(f"\rElapsed: {self.format_time(elapsed)} | "
-                      f"Remaining: {self.format_time(remaining)} | "
-                      f"Latest ping: {data['latency_ms'] or 'N/A'}ms", end='', flush=True)
+                # Display progress, throttled so short intervals don't
+                # write and flush the terminal on every sample
+                now_ns = time.monotonic_ns()
+                if now_ns >= next_progress_ns:
+                    self.print_progress(row, start_time, end_time)
+                    # Skip any deadlines missed while sampling overran
+                    missed = (now_ns - next_progress_ns) // PROGRESS_INTERVAL_NS
+                    next_progress_ns += (missed + 1) * PROGRESS_INTERVAL_NS
                 
-                # Wait for next interval
-                time.sleep(self.interval)
+                # Sleep until the next absolute deadline so the time spent
+                # sampling does not stretch the interval
+                next_tick += self.interval
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # Overran the interval; resynchronise instead of bursting
+                    next_tick = time.monotonic()
                 
         except KeyboardInterrupt:
             self.running = False
+        finally:
+            self.close()
+        
+        # The throttle may have skipped the last sample's update
+        if row is not None:
+            self.print_progress(row, start_time, end_time)
         
         print(f"\nMonitoring completed!")
         print(f"Data saved to: {self.output_file}")
         
-        # Generate plots and statistics
-        self.create_plots()
+        self.print_statistics()
+        print(f"Generate plots with: python plot_csv.py {self.output_file}")
 
 def parse_arguments():
     """Parse command line arguments"""
@@ -430,11 +549,14 @@ Examples:
                        default=5,
                        help='Sampling interval in seconds (default: 5)')
     
-    parser.add_argument('-o', '--output',
-                       help='Output CSV filename (default: auto-generated with timestamp)')
+    parser.add_argument('--info-interval',
+                       type=float,
+                       default=60,
+                       help='Seconds between reads of frequency, width and TX power (default: 60)')
     
-    parser.add_argument('-p', '--plot-dir',
-                       help='Directory to save plots (default: auto-generated with timestamp)')
+    parser.add_argument('-o', '--output',
+                       help='Output CSV filename, or a .parquet filename to write Parquet '
+                            '(default: auto-generated CSV with timestamp)')
     
     return parser.parse_args()
 
@@ -448,28 +570,23 @@ def main():
     else:
         output_file = f"network_monitor_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
     
-    # Use provided plot directory or generate one
-    plot_dir = args.plot_dir or f"network_plots_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    
     print(f"Network Monitor Configuration:")
     print(f"  Target IP: {args.ip}")
     print(f"  Interface: {args.interface}")
     print(f"  Duration: {args.duration} seconds ({args.duration//60} minutes)")
     print(f"  Interval: {args.interval} seconds")
+    print(f"  Info Interval: {args.info_interval} seconds")
     print(f"  Output: {output_file}")
-    print(f"  Plot Directory: {plot_dir}")
     print()
     
     # Check for required dependencies
-    try:
-        import matplotlib.pyplot as plt
-        import pandas as pd
-        import numpy as np
-    except ImportError as e:
-        print(f"Error: Missing required dependency: {e}")
-        print("Please install required packages:")
-        print("  pip install matplotlib pandas numpy")
-        sys.exit(1)
+    if output_file.endswith('.parquet'):
+        try:
+            import pyarrow
+        except ImportError as e:
+            print(f"Error: Parquet output requires pyarrow: {e}")
+            print("  pip install pyarrow")
+            sys.exit(1)
     
     # Create and run monitor
     monitor = NetworkMonitor(
@@ -477,8 +594,8 @@ def main():
         interface=args.interface,
         duration=args.duration,
         interval=args.interval,
-        output_file=output_file,
-        plot_dir=plot_dir
+        info_interval=args.info_interval,
+        output_file=output_file
     )
     
     monitor.run()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import matplotlib
+    matplotlib.use("Agg")  # Plots are only written to files, never shown
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+    import pandas as pd
+    import numpy as np
+except ImportError as e:
+    print(f"Error: Missing required dependency: {e}")
+    print("Please install required packages:")
+    print("  pip install matplotlib pandas numpy")
+    sys.exit(1)
+
+# Narrowest dtypes that hold each column once loaded for plotting; dBm and MHz
+# values are whole numbers, and frequencies need 32 bits for 60 GHz channels
+# (802.11ad channel 6 is 69120 MHz)
+COLUMN_DTYPES = {
+    'latency_ms': 'float32',
+    'rx_bitrate_mbps': 'float32',
+    'tx_bitrate_mbps': 'float32',
+    'signal_strength_dbm': 'Int16',
+    'frequency_mhz': 'Int32',
+    'width_mhz': 'Int16',
+    'centre_frequency_mhz': 'Int32',
+    'tx_power_dbm': 'float32',
+}
+
+# Resolution of the saved PNGs
+PLOT_DPI = 100
+
+# Plot layout, in the order the metrics appear in the overview
+PlotSpec = namedtuple('PlotSpec', 'column title ylabel color filename')
+PLOT_CONFIGS = (
+    PlotSpec('latency_ms', 'Ping Latency Over Time', 'Latency (ms)', '#2E86C1', 'latency.png'),
+    PlotSpec('rx_bitrate_mbps', 'RX Bitrate Over Time', 'RX Bitrate (Mbps)', '#28B463', 'rx_bitrate.png'),
+    PlotSpec('tx_bitrate_mbps', 'TX Bitrate Over Time', 'TX Bitrate (Mbps)', '#E74C3C', 'tx_bitrate.png'),
+    PlotSpec('signal_strength_dbm', 'Signal Strength Over Time', 'Signal Strength (dBm)', '#8E44AD', 'signal_strength.png'),
+    PlotSpec('frequency_mhz', 'Operating Frequency Over Time', 'Frequency (MHz)', '#F39C12', 'frequency.png'),
+    PlotSpec('width_mhz', 'Channel Width Over Time', 'Width (MHz)', '#17A2B8', 'channel_width.png'),
+    PlotSpec('centre_frequency_mhz', 'Centre Frequency Over Time', 'Centre Frequency (MHz)', '#FD7E14', 'centre_frequency.png'),
+    PlotSpec('tx_power_dbm', 'TX Power Over Time', 'TX Power (dBm)', '#6F42C1', 'tx_power.png'),
+)
+
+# Simplify and chunk long line paths for faster rasterization
+PLOT_RCPARAMS = {
+    'font.size': 10,
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+}
+
+# Series longer than LTTB_MIN_POINTS are downsampled to LTTB_POINTS before plotting
+LTTB_MIN_POINTS = 2000
+LTTB_POINTS = 1000
+
+def lttb_indices(x, y, n_out):
+    """Pick n_out indices of (x, y) with Largest-Triangle-Three-Buckets"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    # The first and last points are kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previously kept
+        # point and the average of the next bucket
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    
+    return indices
+
+def plot_points(df, column):
+    """Return the timestamp and column of the valid rows, downsampled for long captures"""
+    valid = df.loc[df[column].notna(), ['timestamp', column]]
+    if len(valid) > LTTB_MIN_POINTS:
+        x = valid['timestamp'].to_numpy().astype(np.int64).astype(np.float64)
+        y = valid[column].to_numpy(dtype=np.float64)
+        valid = valid.iloc[lttb_indices(x, y, LTTB_POINTS)]
+    return valid
+
+def plot_metric(ax, points, n_samples, config, min_val, mean_val, max_val):
+    """Draw one metric's plot_points with its min/mean/max lines onto ax"""
+    column = config.column
+    
+    # Plot the data
+    ax.plot(points['timestamp'],
+           points[column],
+           color=config.color,
+           linewidth=1.5,
+           alpha=0.8,
+           label=f'{column.replace("_", " ").title()}')
+    
+    # Add horizontal lines for min, mean, max
+    ax.axhline(y=mean_val, color='red', linestyle='--', alpha=0.7, label=f'Mean: {mean_val:.2f}')
+    ax.axhline(y=min_val, color='green', linestyle=':', alpha=0.7, label=f'Min: {min_val:.2f}')
+    ax.axhline(y=max_val, color='orange', linestyle=':', alpha=0.7, label=f'Max: {max_val:.2f}')
+    
+    # Formatting
+    ax.set_title(config.title, fontsize=14, fontweight='bold', pad=20)
+    ax.set_xlabel('Time', fontsize=12)
+    ax.set_ylabel(config.ylabel, fontsize=12)
+    ax.grid(True, alpha=0.3)
+    ax.legend(loc='upper right', framealpha=0.9)
+    
+    # Format x-axis
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
+    ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=max(1, n_samples // 20)))
+    plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+
+def render_metric(points, n_samples, config, stats, plot_dir):
+    """Save one metric as its own PNG; runs in a worker process"""
+    plt.rcParams.update(PLOT_RCPARAMS)
+    fig, ax = plt.subplots(figsize=(12, 8))
+    plot_metric(ax, points, n_samples, config, *stats)
+    fig.tight_layout()
+    fig.savefig(os.path.join(plot_dir, config.filename), dpi=PLOT_DPI, bbox_inches='tight')
+    plt.close(fig)
+
+def save_overview(fig, metrics, n_samples, plot_dir):
+    """Draw every metric onto its overview axes and save overview.png"""
+    for ax, points, config, stats in metrics:
+        plot_metric(ax, points, n_samples, config, *stats)
+    
+    fig.tight_layout(rect=(0, 0, 1, 0.98))
+    fig.savefig(os.path.join(plot_dir, 'overview.png'), dpi=PLOT_DPI, bbox_inches='tight')
+    plt.close(fig)
+
+def calculate_statistics(data):
+    """Calculate min, mean, max for a data column"""
+    values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+    if np.isnan(values).all():
+        return None, None, None
+    
+    return float(np.nanmin(values)), float(np.nanmean(values)), float(np.nanmax(values))
+
+def load_data(data_file):
+    """Read a monitor CSV or Parquet file into a DataFrame with parsed timestamps"""
+    if data_file.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        df = pq.read_table(data_file).to_pandas(self_destruct=True)
+        return df.astype(COLUMN_DTYPES)
+    
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+    except ImportError:
+        df = pd.read_csv(data_file)
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        return df.astype(COLUMN_DTYPES)
+    
+    # Arrow parses timestamps inline; numeric types are fixed so columns
+    # that never got a value still come back as float rather than null
+    column_types = {col: pa.float64() for col in COLUMN_DTYPES}
+    column_types['timestamp'] = pa.timestamp('s')
+    table = pacsv.read_csv(data_file,
+                           convert_options=pacsv.ConvertOptions(column_types=column_types))
+    return table.to_pandas(self_destruct=True).astype(COLUMN_DTYPES)
+
+def create_plots(data_file, plot_dir):
+    """Generate plots for each data category"""
+    print(f"\nGenerating plots and calculating statistics for {data_file}...")
+    
+    # Read the logged data
+    try:
+        df = load_data(data_file)
+    except Exception as e:
+        print(f"Error reading data file: {e}")
+        return
+    
+    try:
+        os.makedirs(plot_dir, exist_ok=True)
+    except OSError as e:
+        print(f"Error creating plot directory: {e}")
+        return
+    
+    # Configure matplotlib for better appearance
+    plt.style.use('default')
+    plt.rcParams['figure.figsize'] = (12, 8)
+    plt.rcParams.update(PLOT_RCPARAMS)
+    
+    print("\nStatistical Summary:")
+    print("=" * 60)
+    
+    fig, axes = plt.subplots(4, 2, figsize=(16, 20))
+    fig.suptitle('Network Monitoring Overview', fontsize=16, fontweight='bold')
+    
+    # Metrics with data to plot, as (ax, points, config, stats)
+    metrics = []
+    for ax, config in zip(axes.flat, PLOT_CONFIGS):
+        column = config.column
+        
+        # Skip if column doesn't exist or has no data
+        if column not in df.columns:
+            ax.text(0.5, 0.5, 'No Data', ha='center', va='center', transform=ax.transAxes)
+            ax.set_title(config.title)
+            continue
+        
+        # Calculate statistics
+        min_val, mean_val, max_val = calculate_statistics(df[column])
+        
+        if min_val is None:
+            print(f"{config.title:<30}: No valid data")
+            ax.text(0.5, 0.5, 'No Valid Data', ha='center', va='center', transform=ax.transAxes)
+            ax.set_title(config.title)
+            continue
+        
+        # Print statistics
+        print(f"{config.title:<30}: Min={min_val:.2f}, Mean={mean_val:.2f}, Max={max_val:.2f}")
+        metrics.append((ax, plot_points(df, column), config, (min_val, mean_val, max_val)))
+    
+    # Individual plots are rendered in worker processes while the overview
+    # is drawn here; each worker only receives the (downsampled) points it plots
+    try:
+        if metrics:
+            workers = min(len(metrics), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                renders = [pool.submit(render_metric, points, len(df), config, stats, plot_dir)
+                           for _, points, config, stats in metrics]
+                save_overview(fig, metrics, len(df), plot_dir)
+                
+                # Wait for the individual plots
+                for render in renders:
+                    render.result()
+        else:
+            save_overview(fig, metrics, len(df), plot_dir)
+    except Exception as e:
+        plt.close(fig)
+        print(f"Error generating plots: {e}")
+        return
+    
+    print(f"Overview plot saved as: overview.png")
+    print("=" * 60)
+    print(f"Plots saved to directory: {plot_dir}")
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description='Plot network metrics logged by concurrent_log.py',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+  %(prog)s network_monitor_20250101_120000.csv      # Plot into network_monitor_20250101_120000_csv_plots/
+  %(prog)s network_monitor_*.csv                    # Plot several runs, one directory each
+  %(prog)s run.parquet -p plots                     # Plot a Parquet log into plots/
+        '''
+    )
+    
+    parser.add_argument('files',
+                       nargs='+',
+                       help='CSV or .parquet files written by the monitor')
+    
+    parser.add_argument('-p', '--plot-dir',
+                       help='Directory to save plots (default: <file name>_<extension>_plots; '
+                            'with several files, one subdirectory per file)')
+    
+    return parser.parse_args()
+
+def main():
+    # Parse command line arguments
+    args = parse_arguments()
+    
+    for data_file in args.files:
+        # Keep the extension so run.csv and run.parquet get separate directories
+        root, ext = os.path.splitext(data_file)
+        name = root + ext.replace('.', '_')
+        if args.plot_dir is None:
+            plot_dir = name + '_plots'
+        elif len(args.files) > 1:
+            plot_dir = os.path.join(args.plot_dir, os.path.basename(name))
+        else:
+            plot_dir = args.plot_dir
+        
+        create_plots(data_file, plot_dir)
+
+if __name__ == "__main__":
+    main()